@@ -1,17 +1,54 @@
 import argparse
-from dataclasses import dataclass, field
-from typing import List, Optional
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 from pathlib import Path
 from datetime import datetime
+from email.message import Message
 import time
-from urllib.parse import urlparse, urlunparse
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urljoin, urlsplit, urlunsplit
+from urllib.request import getproxies, proxy_bypass
+import base64
+import functools
+import io
+import http.client
+import socket
+import ssl
+import threading
 import csv
 import sys
 
 
-@dataclass
+# Only the start of the body is inspected (to tell real text files from HTML
+# error pages), so ask servers not to send more than that.
+_SNIFF_BYTES = 4096
+
+# Buffer size for reading input files and writing the results CSV.
+_IO_BUFFER_SIZE = 1 << 20
+
+# Request headers are the same for every request, so build them once.
+# Asking for an uncompressed body keeps the sniffed prefix readable as-is.
+_HEADERS = {"User-Agent": "llms-checker/1.0", "Accept": "*/*", "Accept-Encoding": "identity"}
+_RANGED_HEADERS = {**_HEADERS, "Range": f"bytes=0-{_SNIFF_BYTES - 1}"}
+
+# Leftover body bytes we are willing to read just to keep a connection reusable.
+_DRAIN_LIMIT = 64 * 1024
+
+_MAX_REDIRECTS = 10
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Keep-alive connections of the check running on each worker thread
+# (see _pooled_connection and close_pooled_connections).
+_connections = threading.local()
+
+
+# Slots drop the per-instance __dict__, which adds up when scanning many
+# domains. dataclass(slots=True) needs Python 3.10+; older versions skip it.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class UrlAttempt:
     url: str
     http_status: Optional[int]
@@ -20,7 +57,7 @@ class UrlAttempt:
     looks_like_html: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DomainCheckResult:
     domain: str
     url_checked: str
@@ -40,20 +77,22 @@ def normalize_domain(domain: str) -> str:
     if not domain:
         return ""
 
-    if domain.startswith(("http://", "https://")):
-        return domain.rstrip("/")
+    # Most inputs have no trailing slash; skip the rstrip copy for those.
+    base = domain.rstrip("/") if domain[-1] == "/" else domain
+    if domain.startswith(("https://", "http://")):
+        return base
 
     # Prepend https scheme by default
-    return f"https://{domain.rstrip('/')}"
+    return "https://" + base
 
 
 def build_llms_url(base_url: str) -> str:
     """
     Given a base URL, construct the llms.txt URL.
     """
-    parsed = urlparse(base_url)
+    parsed = urlsplit(base_url)
     # llms.txt is typically served from the site root.
-    return urlunparse(parsed._replace(path="/llms.txt", query="", fragment=""))
+    return urlunsplit((parsed.scheme, parsed.netloc, "/llms.txt", "", ""))
 
 
 def build_candidate_llms_urls(domain: str, try_www_variants: bool = True) -> List[str]:
@@ -70,7 +109,9 @@ def build_candidate_llms_urls(domain: str, try_www_variants: bool = True) -> Lis
     if not base_url:
         return []
 
-    parsed = urlparse(base_url)
+    # normalize_domain() always yields a scheme, so one split is all we need;
+    # the candidate URLs are then assembled directly from its parts.
+    parsed = urlsplit(base_url)
     scheme = parsed.scheme or "https"
     host = parsed.netloc
     if not host:
@@ -90,16 +131,280 @@ def build_candidate_llms_urls(domain: str, try_www_variants: bool = True) -> Lis
         if not h or h.lower() in seen:
             continue
         seen.add(h.lower())
-        out.append(urlunparse((scheme, h, "/llms.txt", "", "", "")))
+        out.append(scheme + "://" + h + "/llms.txt")
     return out
 
 
+_system_getaddrinfo = socket.getaddrinfo
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    return tuple(_system_getaddrinfo(host, port, family, type, proto, flags))
+
+
+def _getaddrinfo_with_cache(host, port, family=0, type=0, proto=0, flags=0):
+    return list(_cached_getaddrinfo(host, port, family, type, proto, flags))
+
+
+def install_dns_cache() -> None:
+    """
+    Cache hostname lookups in-process for the rest of the run.
+
+    Replaces socket.getaddrinfo with a memoised lookup. Hits come from
+    reconnects within one domain's check: retries, the fallback GET after a
+    416, and redirects to a host whose connection was already closed.
+    (www/non-www variants are different hostnames, and duplicate inputs are
+    dropped by dedupe_domains before any lookup.) Failed lookups are not
+    cached, so they are retried normally.
+
+    Entries never expire (there is no TTL): a scan lasts minutes, which is
+    short next to typical DNS TTLs, so a stale address is not a concern.
+    """
+    socket.getaddrinfo = _getaddrinfo_with_cache
+
+
+def install_ipv4_only() -> None:
+    """
+    Resolve hostnames to IPv4 addresses only for the rest of the run.
+
+    Skips the AAAA half of every lookup and avoids hosts whose broken IPv6
+    route would otherwise stall a connection attempt until it times out.
+    Wraps whatever socket.getaddrinfo is installed, so it combines with
+    install_dns_cache() (call that first).
+    """
+    resolve = socket.getaddrinfo
+
+    def getaddrinfo_ipv4(host, port, family=0, type=0, proto=0, flags=0):
+        if family == socket.AF_UNSPEC:
+            family = socket.AF_INET
+        return resolve(host, port, family, type, proto, flags)
+
+    socket.getaddrinfo = getaddrinfo_ipv4
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context(verify_tls: bool = True) -> ssl.SSLContext:
+    """
+    SSL context shared by all HTTPS connections, so CA certificates are loaded
+    only once. verify_tls=False skips certificate and hostname checks (--insecure).
+
+    Mirrors what http.client sets up when it builds its own default context
+    (as urlopen did): ALPN "http/1.1" and TLS 1.3 post-handshake auth.
+    """
+    context = ssl.create_default_context()
+    if not verify_tls:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    context.set_alpn_protocols(["http/1.1"])
+    if context.post_handshake_auth is not None:
+        context.post_handshake_auth = True
+    return context
+
+
+@functools.lru_cache(maxsize=None)
+def _system_proxies() -> Dict[str, str]:
+    """
+    Proxy settings as urllib sees them: HTTP_PROXY/HTTPS_PROXY, or the system
+    settings on Windows and macOS.
+    """
+    return getproxies()
+
+
+@functools.lru_cache(maxsize=4096)
+def _proxy_for(scheme: str, netloc: str) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    Return (proxy host:port, extra request headers) for scheme://netloc, or
+    None to connect directly.
+
+    Follows urllib's ProxyHandler: hosts matched by no_proxy (or the system
+    bypass list) go direct, and credentials in the proxy URL are sent as
+    Basic Proxy-Authorization.
+    """
+    proxy = _system_proxies().get(scheme)
+    if not proxy or proxy_bypass(netloc):
+        return None
+
+    parts = urlsplit(proxy if "://" in proxy else "//" + proxy)
+    headers: Dict[str, str] = {}
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+    return parts.netloc.rpartition("@")[2], headers
+
+
+def _pooled_connection(
+    scheme: str,
+    netloc: str,
+    timeout: float,
+    verify_tls: bool = True,
+) -> http.client.HTTPConnection:
+    """
+    Return this thread's keep-alive connection for (scheme, netloc), creating it if needed.
+
+    Connections are per thread so worker threads never share a socket, and
+    check_single_domain() closes them all when its check is done.
+
+    When a proxy applies, the connection goes to the proxy instead; HTTPS
+    requests are tunnelled through it with CONNECT.
+    """
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+
+    key = (scheme, netloc, verify_tls)
+    conn = pool.get(key)
+    if conn is None:
+        proxy = _proxy_for(scheme, netloc)
+        address = proxy[0] if proxy else netloc
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(address, timeout=timeout, context=_ssl_context(verify_tls))
+            if proxy:
+                conn.set_tunnel(netloc, headers=proxy[1])
+        else:
+            conn = http.client.HTTPConnection(address, timeout=timeout)
+        pool[key] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def close_pooled_connections() -> None:
+    """
+    Close and forget every keep-alive connection opened by this thread.
+    """
+    pool = getattr(_connections, "pool", None)
+    if not pool:
+        return
+    for conn in pool.values():
+        conn.close()
+    pool.clear()
+
+
+def _get_once(
+    url: str,
+    headers: Dict[str, str],
+    timeout: float,
+    verify_tls: bool = True,
+) -> Tuple[int, str, Message, bytes]:
+    """
+    Send one GET over a pooled connection and return (status, reason, headers, body sample).
+
+    Small leftover bodies are drained so the connection stays reusable; if the
+    server sends more than that, the connection is closed instead.
+    """
+    parts = urlsplit(url)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+
+    proxy = _proxy_for(parts.scheme, parts.netloc)
+    if proxy and parts.scheme == "http":
+        # A plain-HTTP proxy takes the absolute URL as the request target.
+        target = f"http://{parts.netloc}{target}"
+        if proxy[1]:
+            headers = {**headers, **proxy[1]}
+
+    conn = _pooled_connection(parts.scheme, parts.netloc, timeout, verify_tls)
+    reused = conn.sock is not None
+    try:
+        try:
+            conn.request("GET", target, headers=headers)
+            resp = conn.getresponse()
+        except ConnectionError:
+            if not reused:
+                raise
+            # The server dropped the idle keep-alive connection; retry once on a fresh one.
+            conn.close()
+            conn.request("GET", target, headers=headers)
+            resp = conn.getresponse()
+
+        body_sample = resp.read(_SNIFF_BYTES) or b""
+        if not resp.isclosed():
+            resp.read(_DRAIN_LIMIT)
+        if not resp.isclosed():
+            conn.close()
+        resp.close()
+    except BaseException:
+        conn.close()
+        raise
+
+    return resp.status, resp.reason, resp.headers, body_sample
+
+
+def open_llms_url(
+    url: str,
+    timeout: float,
+    follow_redirects: bool = True,
+    verify_tls: bool = True,
+) -> Tuple[int, str, Optional[str], bytes]:
+    """
+    GET a candidate llms.txt URL, requesting only the first _SNIFF_BYTES bytes.
+
+    Returns (status, reason, content type, body sample) of the final response.
+
+    A HEAD request would be even cheaper, but we need a body sample to detect
+    HTML "not found" pages, so a ranged GET is used instead. Servers that do
+    not support ranges simply answer 200 with the full body; an empty file may
+    answer 416 (Range Not Satisfiable), in which case we retry once without it.
+
+    Redirects are followed (up to _MAX_REDIRECTS), like urllib does, unless
+    follow_redirects is False; the 3xx response is then returned as is.
+    verify_tls=False skips certificate checks for self-signed hosts.
+    """
+    headers = _RANGED_HEADERS
+    for _ in range(_MAX_REDIRECTS + 1):
+        status, reason, resp_headers, body_sample = _get_once(url, headers, timeout, verify_tls)
+        if status == 416 and headers is _RANGED_HEADERS:
+            headers = _HEADERS
+            status, reason, resp_headers, body_sample = _get_once(url, headers, timeout, verify_tls)
+
+        location = resp_headers.get("Location")
+        if not follow_redirects or status not in _REDIRECT_STATUSES or not location:
+            break
+        try:
+            next_url = urljoin(url, location)
+            next_scheme = urlsplit(next_url).scheme
+        except ValueError:
+            # Unparseable Location (e.g. a broken IPv6 literal): stop at the 3xx.
+            break
+        if next_scheme not in ("http", "https"):
+            break
+        url = next_url
+
+    return status, reason, resp_headers.get("Content-Type", None), body_sample
+
+
+# Failures that mean "no usable answer from this URL": DNS/connection/TLS
+# errors and timeouts (OSError), malformed HTTP responses and invalid URLs or
+# ports (HTTPException, including InvalidURL) and hostnames that cannot be
+# IDNA-encoded (UnicodeError). Anything else is a bug and is left to propagate.
+_FETCH_ERRORS = (OSError, http.client.HTTPException, UnicodeError)
+
+# Messages for error types whose str() is unhelpful, looked up by exact type.
+_ERROR_MESSAGES: Dict[type, Callable[[BaseException], str]] = {
+    http.client.BadStatusLine: lambda e: f"invalid HTTP status line: {e.line.strip()}",
+}
+
+
+def describe_fetch_error(e: BaseException) -> str:
+    """
+    Short, human-readable description of a failed fetch for the report.
+    """
+    message = _ERROR_MESSAGES.get(type(e))
+    return message(e) if message else str(e)
+
+
 def fetch_with_retries(
     url: str,
     timeout: float,
     retries: int,
     retry_wait_s: float,
     backoff_factor: float,
+    follow_redirects: bool = True,
+    verify_tls: bool = True,
 ) -> List[UrlAttempt]:
     """
     Fetch a URL with retry/backoff behavior.
@@ -114,48 +419,16 @@ def fetch_with_retries(
     transient_statuses = {429, 500, 502, 503, 504}
 
     for attempt_idx in range(1, max_attempts + 1):
-        req = Request(url, method="GET", headers={"User-Agent": "llms-checker/1.0"})
         try:
-            with urlopen(req, timeout=timeout) as resp:
-                status = resp.getcode()
-
-                # Read a small sample of the body to distinguish real text files
-                # from generic HTML "page not found" responses.
-                body_sample = resp.read(4096) or b""
-                content_type = resp.headers.get("Content-Type", None)
-                lower_sample = body_sample.lower()
-                looks_like_html = b"<html" in lower_sample or b"<!doctype html" in lower_sample
-
-                attempts.append(
-                    UrlAttempt(
-                        url=url,
-                        http_status=status,
-                        error=None,
-                        content_type=content_type,
-                        looks_like_html=looks_like_html,
-                    )
-                )
-                if status in transient_statuses and attempt_idx < max_attempts:
-                    wait = retry_wait_s * (backoff_factor ** (attempt_idx - 1))
-                    time.sleep(wait)
-                    continue
-                return attempts
-        except HTTPError as e:
-            status = e.code
-            attempts.append(
-                UrlAttempt(url=url, http_status=status, error=str(e), content_type=None, looks_like_html=False)
+            status, reason, content_type, body_sample = open_llms_url(
+                url, timeout, follow_redirects=follow_redirects, verify_tls=verify_tls
             )
-            if status in transient_statuses and attempt_idx < max_attempts:
-                wait = retry_wait_s * (backoff_factor ** (attempt_idx - 1))
-                time.sleep(wait)
-                continue
-            return attempts
-        except URLError as e:
+        except _FETCH_ERRORS as e:
             attempts.append(
                 UrlAttempt(
                     url=url,
                     http_status=None,
-                    error=str(e.reason),
+                    error=describe_fetch_error(e),
                     content_type=None,
                     looks_like_html=False,
                 )
@@ -165,21 +438,36 @@ def fetch_with_retries(
                 time.sleep(wait)
                 continue
             return attempts
-        except Exception as e:  # Catch-all to avoid script crash on weird cases
+
+        if status >= 300:
             attempts.append(
                 UrlAttempt(
                     url=url,
-                    http_status=None,
-                    error=str(e),
+                    http_status=status,
+                    error=f"HTTP Error {status}: {reason}",
                     content_type=None,
                     looks_like_html=False,
                 )
             )
-            if attempt_idx < max_attempts:
-                wait = retry_wait_s * (backoff_factor ** (attempt_idx - 1))
-                time.sleep(wait)
-                continue
-            return attempts
+        else:
+            # The body sample distinguishes real text files from generic
+            # HTML "page not found" responses.
+            lower_sample = body_sample.lower()
+            looks_like_html = b"<html" in lower_sample or b"<!doctype html" in lower_sample
+            attempts.append(
+                UrlAttempt(
+                    url=url,
+                    http_status=status,
+                    error=None,
+                    content_type=content_type,
+                    looks_like_html=looks_like_html,
+                )
+            )
+        if status in transient_statuses and attempt_idx < max_attempts:
+            wait = retry_wait_s * (backoff_factor ** (attempt_idx - 1))
+            time.sleep(wait)
+            continue
+        return attempts
 
     return attempts
 
@@ -191,10 +479,14 @@ def check_single_domain(
     retries: int = 0,
     retry_wait_s: float = 1.0,
     backoff_factor: float = 2.0,
+    follow_redirects: bool = True,
+    verify_tls: bool = True,
 ) -> DomainCheckResult:
     """
     Check if a single domain exposes /llms.txt.
     Tries HTTPS first (if no scheme given).
+
+    With follow_redirects=False a 3xx answer counts as "no llms.txt at that URL".
     """
     if not domain.strip():
         return DomainCheckResult(
@@ -217,34 +509,42 @@ def check_single_domain(
 
     all_attempts: List[UrlAttempt] = []
 
-    for url in candidate_urls:
-        attempts = fetch_with_retries(
-            url=url,
-            timeout=timeout,
-            retries=retries,
-            retry_wait_s=retry_wait_s,
-            backoff_factor=backoff_factor,
-        )
-        all_attempts.extend(attempts)
-
-        # Stop early if any attempt clearly succeeded with a real llms.txt
-        for a in attempts:
-            if a.http_status is not None and 200 <= a.http_status < 300:
-                # Heuristic: treat as llms.txt only if it doesn't look like HTML
-                # and the content type is text-like or unspecified.
-                ct = (a.content_type or "").lower()
-                if a.looks_like_html:
-                    continue
-                if ct and not ct.startswith("text/") and "llms" not in ct:
-                    continue
-                return DomainCheckResult(
-                    domain=domain,
-                    url_checked=a.url,
-                    has_llms_txt=True,
-                    http_status=a.http_status,
-                    error=None,
-                    attempts=all_attempts,
-                )
+    # Connections are only reused within this domain's check (retries and
+    # redirects to a host already contacted) and closed afterwards, so open
+    # sockets never pile up across a long scan.
+    try:
+        for url in candidate_urls:
+            attempts = fetch_with_retries(
+                url=url,
+                timeout=timeout,
+                retries=retries,
+                retry_wait_s=retry_wait_s,
+                backoff_factor=backoff_factor,
+                follow_redirects=follow_redirects,
+                verify_tls=verify_tls,
+            )
+            all_attempts.extend(attempts)
+
+            # Stop early if any attempt clearly succeeded with a real llms.txt
+            for a in attempts:
+                if a.http_status is not None and 200 <= a.http_status < 300:
+                    # Heuristic: treat as llms.txt only if it doesn't look like HTML
+                    # and the content type is text-like or unspecified.
+                    ct = (a.content_type or "").lower()
+                    if a.looks_like_html:
+                        continue
+                    if ct and not ct.startswith("text/") and "llms" not in ct:
+                        continue
+                    return DomainCheckResult(
+                        domain=domain,
+                        url_checked=a.url,
+                        has_llms_txt=True,
+                        http_status=a.http_status,
+                        error=None,
+                        attempts=all_attempts,
+                    )
+    finally:
+        close_pooled_connections()
 
     statuses = [a.http_status for a in all_attempts if a.http_status is not None]
     errors = [a.error for a in all_attempts if a.error]
@@ -272,13 +572,123 @@ def check_single_domain(
     )
 
 
+def iter_check_results(
+    domains: Iterable[str],
+    concurrency: int = 1,
+    delay: float = 0.0,
+    **check_kwargs,
+) -> Iterator[DomainCheckResult]:
+    """
+    Check many domains, overlapping the network waits of up to `concurrency`
+    requests at a time, and yield each result as soon as it is available.
+
+    Each check blocks on sockets (which releases the GIL), so a thread pool is
+    enough to run them side by side without extra dependencies. Threads are
+    used rather than processes: the work is I/O-bound and process start-up and
+    pickling would cost more than they save.
+
+    Results are yielded in the same order as `domains`. Only a small window of
+    checks (twice the worker count) is in flight or waiting to be consumed at
+    any time, so memory does not grow with the length of the input.
+
+    `delay` is the minimum time between the starts of two domain checks,
+    shared by all workers, so it caps the request rate at 1/delay domains per
+    second however many workers run. Nothing waits after the last domain.
+    """
+    pacing_lock = threading.Lock()
+    next_start = 0.0
+
+    def check(domain: str) -> DomainCheckResult:
+        nonlocal next_start
+        if delay > 0:
+            # Reserve the next start slot under the lock, then sleep outside it.
+            with pacing_lock:
+                now = time.monotonic()
+                start = max(now, next_start)
+                next_start = start + delay
+            if start > now:
+                time.sleep(start - now)
+        return check_single_domain(domain, **check_kwargs)
+
+    workers = max(1, concurrency)
+    if workers == 1:
+        for d in domains:
+            yield check(d)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = deque()
+        for d in domains:
+            pending.append(executor.submit(check, d))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def dedupe_domains(domains: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Drop domains that would be checked identically (same scheme and host,
+    ignoring case), e.g. "Example.com" and "https://example.com/".
+
+    Returns the unique domains (first spelling wins) and, for every input
+    domain, the index of its representative in that list.
+    """
+    first_index: Dict[str, int] = {}
+    unique: List[str] = []
+    positions: List[int] = []
+    for d in domains:
+        parsed = urlsplit(normalize_domain(d))
+        key = f"{parsed.scheme}://{parsed.netloc}".lower() if parsed.netloc else d.strip()
+        idx = first_index.get(key)
+        if idx is None:
+            idx = first_index[key] = len(unique)
+            unique.append(d)
+        positions.append(idx)
+    return unique, positions
+
+
+def expand_duplicate_results(
+    domains: List[str],
+    positions: List[int],
+    unique_results: Iterable[DomainCheckResult],
+) -> Iterator[DomainCheckResult]:
+    """
+    Turn results for the deduplicated list back into one result per input domain.
+
+    `domains` and `positions` are the input list and the mapping returned by
+    dedupe_domains(); `unique_results` must follow the order of the unique list.
+    Duplicates reuse their representative's result under their own spelling,
+    and a result is only held on to while a later duplicate still needs it.
+    """
+    remaining = Counter(positions)
+    held: Dict[int, DomainCheckResult] = {}
+    unique_iter = iter(unique_results)
+    next_unique = 0
+
+    for domain, idx in zip(domains, positions):
+        if idx == next_unique:
+            result = next(unique_iter)
+            next_unique += 1
+        else:
+            result = held[idx]
+
+        remaining[idx] -= 1
+        if remaining[idx]:
+            held[idx] = result
+        else:
+            held.pop(idx, None)
+
+        yield result if result.domain == domain else replace(result, domain=domain)
+
+
 def load_domains(path: str) -> List[str]:
     """
     Load domains from a text file.
     - Ignores empty lines and lines starting with '#'.
     """
     domains: List[str] = []
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
         for line in f:
             raw = line.strip()
             if not raw or raw.startswith("#"):
@@ -294,28 +704,30 @@ def load_domains_from_csv(path: str, domain_column: str = "domain") -> List[str]
     - Ignores rows where the domain cell is empty.
     """
     domains: List[str] = []
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
+    with open(path, "r", encoding="utf-8", newline="", buffering=_IO_BUFFER_SIZE) as f:
+        # Only one column is needed, so read rows as lists and index into them
+        # instead of building a dict per row.
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
         # Make domain column matching more forgiving (case-insensitive).
-        fieldname_map = {name.lower(): name for name in fieldnames}
-        resolved_domain_column = fieldname_map.get(domain_column.lower())
-        if not resolved_domain_column:
+        column_index_map = {name.lower(): idx for idx, name in enumerate(fieldnames)}
+        domain_idx = column_index_map.get(domain_column.lower())
+        if domain_idx is None:
             raise ValueError(
                 f"CSV file does not contain a '{domain_column}' column. "
                 f"Available columns: {', '.join(fieldnames)}"
             )
         for row in reader:
-            raw = (row.get(resolved_domain_column) or "").strip()
+            raw = row[domain_idx].strip() if domain_idx < len(row) else ""
             if not raw:
                 continue
             domains.append(raw)
     return domains
 
 
-def write_csv(results: List[DomainCheckResult], output_path: str) -> None:
+def write_csv(results: Iterable[DomainCheckResult], csvfile: TextIO) -> None:
     """
-    Write results to a CSV file.
+    Write results to an open CSV file, one row per result as it arrives.
 
     For your current workflow we keep it very simple:
     - domain
@@ -366,18 +778,17 @@ def write_csv(results: List[DomainCheckResult], output_path: str) -> None:
 
         return " ; ".join(parts)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["domain", "contains_llms_txt", "http_status", "details"])
-        for r in results:
-            writer.writerow(
-                [
-                    r.domain,
-                    "yes" if r.has_llms_txt else "no",
-                    r.http_status if r.http_status is not None else "",
-                    explain_status(r),
-                ]
-            )
+    writer = csv.writer(csvfile)
+    writer.writerow(["domain", "contains_llms_txt", "http_status", "details"])
+    writer.writerows(
+        (
+            r.domain,
+            "yes" if r.has_llms_txt else "no",
+            r.http_status if r.http_status is not None else "",
+            explain_status(r),
+        )
+        for r in results
+    )
 
 
 def build_timestamped_output_path(filename: str = "results.csv") -> str:
@@ -411,53 +822,94 @@ def resolve_output_csv_path(output_csv_arg: str) -> str:
     return str(p / "results.csv")
 
 
-def print_summary(results: List[DomainCheckResult]) -> None:
+_ROW_FOUND = " -> llms.txt: YES"
+_ROW_NOT_FOUND = " -> llms.txt: NO"
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ResultSummary:
     """
-    Print a human-readable summary to the console.
+    Running totals for the console summary.
+
+    Results are added one at a time as they come in, so the full list of
+    DomainCheckResult objects (and their attempts) never has to be kept.
     """
-    total_in_results = len(results)
-    with_llms = sum(1 for r in results if r.has_llms_txt)
+    total: int = 0
+    with_llms: int = 0
     # Domain-level (final classification)
-    count_domain_404 = sum(1 for r in results if r.http_status == 404)
-    count_domain_403 = sum(1 for r in results if r.http_status == 403)
-    count_domain_429 = sum(1 for r in results if r.http_status == 429)
-
+    count_domain_404: int = 0
+    count_domain_403: int = 0
+    count_domain_429: int = 0
     # Request-level (all HTTP responses across retries + www/non-www)
-    count_http_404 = sum(
-        1 for r in results for a in r.attempts if a.http_status == 404
-    )
-    count_http_403 = sum(
-        1 for r in results for a in r.attempts if a.http_status == 403
-    )
-    count_http_429 = sum(1 for r in results for a in r.attempts if a.http_status == 429)
-    failed = [r for r in results if r.error is not None and r.http_status is None]
-
-    print(f"Total domains processed: {total_in_results}")
-    print(f"Domains with llms.txt: {with_llms}")
-    print(f"Domain result = HTTP 404 Not Found: {count_domain_404}")
-    print(f"Domain result = HTTP 403 Forbidden: {count_domain_403}")
-    print(f"Domain result = HTTP 429 Too Many Requests: {count_domain_429}")
-    #print(f"HTTP 404 responses (all requests): {count_http_404}")
-    #print(f"HTTP 403 responses (all requests): {count_http_403}")
-    #print(f"HTTP 429 responses (all requests): {count_http_429}")
-    print(f"Domains that failed to check (no response): {len(failed)}")
-    print()
-    print("Per-domain results:")
-    print("-" * 60)
-    for r in results:
-        status_str = "YES" if r.has_llms_txt else "NO"
-        extra = ""
+    count_http_404: int = 0
+    count_http_403: int = 0
+    count_http_429: int = 0
+    # (domain, error) of domains that failed to check
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    # Per-domain rows, rendered as they arrive and written out in one call.
+    rows: io.StringIO = field(default_factory=io.StringIO)
+
+    def add(self, r: DomainCheckResult) -> None:
+        self.total += 1
+        if r.has_llms_txt:
+            self.with_llms += 1
+        if r.http_status == 404:
+            self.count_domain_404 += 1
+        elif r.http_status == 403:
+            self.count_domain_403 += 1
+        elif r.http_status == 429:
+            self.count_domain_429 += 1
+        for a in r.attempts:
+            if a.http_status == 404:
+                self.count_http_404 += 1
+            elif a.http_status == 403:
+                self.count_http_403 += 1
+            elif a.http_status == 429:
+                self.count_http_429 += 1
+        if r.error is not None and r.http_status is None:
+            self.failed.append((r.domain, r.error))
+
+        label = _ROW_FOUND if r.has_llms_txt else _ROW_NOT_FOUND
         if r.http_status is not None:
-            extra = f" (HTTP {r.http_status})"
+            self.rows.write(f"{r.domain:<30}{label} (HTTP {r.http_status})\n")
         elif r.error:
-            extra = f" (error: {r.error})"
-        print(f"{r.domain:<30} -> llms.txt: {status_str}{extra}")
+            self.rows.write(f"{r.domain:<30}{label} (error: {r.error})\n")
+        else:
+            self.rows.write(f"{r.domain:<30}{label}\n")
 
-    if failed:
-        print()
-        print("Failed domains (unable to obtain):")
-        for r in failed:
-            print(f"- {r.domain}: {r.error}")
+    def track(self, results: Iterable[DomainCheckResult]) -> Iterator[DomainCheckResult]:
+        """
+        Pass results through unchanged, adding each one to the summary on the way.
+        """
+        for r in results:
+            self.add(r)
+            yield r
+
+    def print(self) -> None:
+        """
+        Print a human-readable summary to the console, in a single write.
+        """
+        lines = [
+            f"Total domains processed: {self.total}\n",
+            f"Domains with llms.txt: {self.with_llms}\n",
+            f"Domain result = HTTP 404 Not Found: {self.count_domain_404}\n",
+            f"Domain result = HTTP 403 Forbidden: {self.count_domain_403}\n",
+            f"Domain result = HTTP 429 Too Many Requests: {self.count_domain_429}\n",
+            #f"HTTP 404 responses (all requests): {self.count_http_404}\n",
+            #f"HTTP 403 responses (all requests): {self.count_http_403}\n",
+            #f"HTTP 429 responses (all requests): {self.count_http_429}\n",
+            f"Domains that failed to check (no response): {len(self.failed)}\n",
+            "\n",
+            "Per-domain results:\n",
+            "-" * 60 + "\n",
+            self.rows.getvalue(),
+        ]
+
+        if self.failed:
+            lines.append("\nFailed domains (unable to obtain):\n")
+            lines.extend(f"- {domain}: {error}\n" for domain, error in self.failed)
+
+        sys.stdout.write("".join(lines))
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -510,13 +962,44 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         "--delay",
         type=float,
         default=0.0,
-        help="Delay (seconds) between domains to reduce rate-limits (default: 0).",
+        help=(
+            "Minimum delay (seconds) between starting two domain checks, across all workers, "
+            "to reduce rate-limits (default: 0)."
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        "--workers",
+        dest="concurrency",
+        type=int,
+        default=32,
+        help="Number of worker threads checking domains in parallel (default: 32). Use 1 for sequential checks.",
     )
     parser.add_argument(
         "--no-www-fallback",
         action="store_true",
         help="Do not try www/non-www variants (default: try both).",
     )
+    parser.add_argument(
+        "--no-follow-redirects",
+        action="store_true",
+        help="Do not follow redirects; a 3xx answer counts as no llms.txt (default: follow).",
+    )
+    parser.add_argument(
+        "--insecure",
+        action="store_true",
+        help="Skip TLS certificate verification (e.g. for self-signed internal hosts).",
+    )
+    parser.add_argument(
+        "--no-dns-cache",
+        action="store_true",
+        help="Do not cache DNS lookups between requests (default: cache them).",
+    )
+    parser.add_argument(
+        "--ipv4-only",
+        action="store_true",
+        help="Resolve and connect over IPv4 only (default: IPv4 and IPv6).",
+    )
     parser.add_argument(
         "--input-format",
         choices=["text", "csv"],
@@ -556,35 +1039,63 @@ def main(argv: Optional[List[str]] = None) -> None:
         print("No domains found in the input file.", file=sys.stderr)
         sys.exit(1)
 
-    results: List[DomainCheckResult] = []
-    for idx, d in enumerate(domains):
-        result = check_single_domain(
-            d,
-            timeout=args.timeout,
-            try_www_variants=not args.no_www_fallback,
-            retries=max(0, args.retries),
-            retry_wait_s=max(0.0, args.retry_wait),
-            backoff_factor=max(1.0, args.backoff),
-        )
-        results.append(result)
-
-        if args.delay > 0 and idx < (len(domains) - 1):
-            time.sleep(args.delay)
-
-    print_summary(results)
+    if not args.no_dns_cache:
+        install_dns_cache()
+    if args.ipv4_only:
+        install_ipv4_only()
 
+    # Open the CSV up front so rows can be written while the scan runs, and so
+    # a bad output path is reported before any domain is checked.
+    output_path: Optional[str] = None
+    csvfile: Optional[TextIO] = None
     if args.output_csv:
         try:
             if args.output_csv == "__TIMESTAMPED__":
                 output_path = build_timestamped_output_path("results.csv")
             else:
                 output_path = resolve_output_csv_path(args.output_csv)
+            # A large buffer turns many small row writes into a few big write() calls.
+            csvfile = open(output_path, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE)
+        except OSError as e:
+            print(f"Failed to write CSV file: {e}", file=sys.stderr)
 
-            write_csv(results, output_path)
-            print()
-            print(f"Results written to CSV: {output_path}")
-        except Exception as e:
+    # Check each distinct scheme+host once; duplicates still get their own output row.
+    unique_domains, positions = dedupe_domains(domains)
+
+    summary = ResultSummary()
+    unique_results = iter_check_results(
+        unique_domains,
+        concurrency=args.concurrency,
+        delay=max(0.0, args.delay),
+        timeout=args.timeout,
+        try_www_variants=not args.no_www_fallback,
+        retries=max(0, args.retries),
+        retry_wait_s=max(0.0, args.retry_wait),
+        backoff_factor=max(1.0, args.backoff),
+        follow_redirects=not args.no_follow_redirects,
+        verify_tls=not args.insecure,
+    )
+    results = summary.track(expand_duplicate_results(domains, positions, unique_results))
+
+    # Checks never raise OSError (fetch_with_retries records those as failed
+    # attempts), so one caught here comes from writing or closing the CSV.
+    csv_written = False
+    if csvfile is not None:
+        try:
+            with csvfile:
+                write_csv(results, csvfile)
+            csv_written = True
+        except OSError as e:
             print(f"Failed to write CSV file: {e}", file=sys.stderr)
+    # Finish the scan if there is no CSV (or writing it failed part-way).
+    for _ in results:
+        pass
+
+    summary.print()
+
+    if csv_written:
+        print()
+        print(f"Results written to CSV: {output_path}")
 
 
 if __name__ == "__main__":